@@ -70,21 +70,71 @@ def draw_bezier(np.int8_t[:, :] canvas, np.float64_t[:] points):
 @cython.boundscheck(False) # turn of bounds-checking for entire function
 @cython.cdivision(True)
 @cython.wraparound(False)
-def planify_curves(image_t[:, :, :] image, np.float64_t[:, :, :] curves):
-    #  cdef np.ndarray[image_t, ndim=3] output
-    cdef image_t[:, :, :] output
+cdef void _planify_curves(image_t[:, :, :] image, np.float64_t[:, :, :] curves, np.int32_t[:] npoints, image_t[:, :, :] output) nogil:
     cdef int ncurves = curves.shape[0]
-    cdef int npoints = curves.shape[2]
-    cdef int dx = image.shape[2]
-    cdef int dy = image.shape[1]
     cdef int dz = image.shape[0]
-    cdef int z, y, x
-
-    output = np.zeros(shape=(ncurves, dz, npoints), dtype=np.int16)
-
-    for z in prange(output.shape[0], nogil=True):
-        for y in range(output.shape[1]):
-            for x in range(output.shape[2]):
-                output[z, y, x] = <image_t>interpolation.tricubicInterpolate(image, curves[z, 0, x], curves[z, 1, x], y)
-
-    return np.asarray(output)
+    cdef int z, c, x
+
+    # Curves of all families are resampled in the same prange over z, each
+    # thread renders whole slices of every family.
+    for z in prange(dz):
+        for c in range(ncurves):
+            for x in range(npoints[c]):
+                output[c, z, x] = <image_t>interpolation.tricubicInterpolate(image, curves[c, 0, x], curves[c, 1, x], z)
+
+
+def planify_curves(image_t[:, :, :] image, families):
+    """
+    Resamples the image along each curve family with a single prange over z.
+
+    families is a list of curve stacks, each one an array of shape
+    (ncurves, 2, npoints). Each family may have its own ncurves and npoints.
+    Returns a list with one image of shape (ncurves, dz, npoints) per family.
+    Each returned image owns its own memory, so keeping one of them alive
+    does not keep the pixels of the other families.
+    """
+    cdef image_t[:, :, :] out_view
+    cdef np.float64_t[:, :, :] curves_view
+    cdef np.int32_t[:] npoints_view
+    cdef int dz = image.shape[0]
+    cdef int total_curves, max_npoints, i
+
+    families = [np.asarray(f, dtype=np.float64) for f in families]
+    if not families:
+        return []
+
+    for f in families:
+        if f.ndim != 3 or f.shape[1] != 2:
+            raise ValueError(
+                "Each curve family must have shape (ncurves, 2, npoints), got %s" % (f.shape,)
+            )
+
+    total_curves = sum(f.shape[0] for f in families)
+    max_npoints = max(f.shape[2] for f in families)
+
+    all_curves = np.zeros(shape=(total_curves, 2, max_npoints), dtype=np.float64)
+    npoints = np.empty(shape=total_curves, dtype=np.int32)
+    i = 0
+    for f in families:
+        all_curves[i:i + f.shape[0], :, :f.shape[2]] = f
+        npoints[i:i + f.shape[0]] = f.shape[2]
+        i += f.shape[0]
+
+    output = np.zeros(shape=(total_curves, dz, max_npoints), dtype=np.asarray(image).dtype)
+
+    out_view = output
+    curves_view = all_curves
+    npoints_view = npoints
+    with nogil:
+        _planify_curves(image, curves_view, npoints_view, out_view)
+
+    # With a single family the output buffer is exactly its image.
+    if len(families) == 1:
+        return [output]
+
+    outputs = []
+    i = 0
+    for f in families:
+        outputs.append(output[i:i + f.shape[0], :, :f.shape[2]].copy())
+        i += f.shape[0]
+    return outputs
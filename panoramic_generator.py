@@ -209,19 +209,9 @@ def main():
 
     #  print(res)
 
-    panoramic_image = draw_bezier.planify_curves(image, np.array(curves))
-    #  plt.imshow(panoramic_image.max(0), cmap="gray")
-    #  plt.show()
-    #  imageio.imsave("panoramic.png", panoramic_image)
-    sx, sy, sz = spacing
-    sx = (
-        ((sx * bx[::2] - sx * bx[1::2]) ** 2 + (sy * by[::2] - sy * by[1::2]) ** 2)
-        ** 0.5
-    ).mean()
-    save_image(panoramic_image, str(output_filename), spacing=(sx, sz, distance))
+    families = [np.array(curves)]
 
     if gen_skeleton:
-        skx, sky = skeleton.normalize_curve(skeleton_points, npoints)
         skeleton_curves = (
             skeleton.calc_parallel_curves(
                 skx, sky, distance=-distance, ncurves=ncurves
@@ -229,9 +219,26 @@ def main():
             + [(skx, sky)]
             + skeleton.calc_parallel_curves(
                 skx, sky, distance=distance, ncurves=ncurves
-            )[::-1]
+            )
         )
 
+        families.append(np.array(skeleton_curves))
+
+    # All the curve families are rendered with a single call
+    panoramic_images = draw_bezier.planify_curves(image, families)
+
+    panoramic_image = panoramic_images[0]
+    #  plt.imshow(panoramic_image.max(0), cmap="gray")
+    #  plt.show()
+    #  imageio.imsave("panoramic.png", panoramic_image)
+    sx, sy, sz = spacing
+    sx = (
+        ((sx * bx[::2] - sx * bx[1::2]) ** 2 + (sy * by[::2] - sy * by[1::2]) ** 2)
+        ** 0.5
+    ).mean()
+    save_image(panoramic_image, str(output_filename), spacing=(sx, sz, distance))
+
+    if gen_skeleton:
         plt.imshow(image[slice_number], cmap="gray")
         for curve in skeleton_curves:
             px, py = curve
@@ -239,7 +246,7 @@ def main():
         plt.axes().set_aspect("equal", "datalim")
         plt.show()
 
-        panoramic_skeleton_image = draw_bezier.planify_curves(image, np.array(curves))
+        panoramic_skeleton_image = panoramic_images[1]
 
         sx, sy, sz = spacing
         sx = (